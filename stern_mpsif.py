@@ -1,16 +1,110 @@
 import json
+import hashlib
+from functools import lru_cache
+import numpy as np
 import dash
 import dash_bootstrap_components as dbc
 from dash import dcc, html, Input, Output
 import plotly.graph_objects as go
 
 # Load JSON data from an external file with UTF-8 encoding
-with open("data.json", "r", encoding="utf-8") as f:
-    data = json.load(f)
+with open("data.json", "rb") as f:
+    raw_data = f.read()
+data = json.loads(raw_data.decode("utf-8"))
+
+# Fingerprint of the loaded dataset, used to key the precomputed metric matrices
+data_version = hashlib.sha1(raw_data).hexdigest()
 
 # Extract available years (assumed to be strings)
 available_years = sorted(list(data.keys()))
 
+# -------------------------
+# Precomputed cross-period metric matrices
+# -------------------------
+
+SEMESTERS = ["Spring", "Fall"]
+
+# Metric key -> (display label, fallback keys used by older reports)
+MATRIX_METRICS = {
+    "6_month_return": ("6-Month Return (%)", []),
+    "1_year_return": ("1-Year Return (%)", ["12_month_return"]),
+    "AUM": ("AUM ($)", ["AUM_end"]),
+    "dividend": ("Dividend ($)", []),
+}
+metric_keys = list(MATRIX_METRICS.keys())
+metric_labels = [MATRIX_METRICS[key][0] for key in metric_keys]
+
+# Only numeric year keys describe a reporting period
+matrix_years = [year for year in available_years if year.isdigit()]
+year_index = {year: i for i, year in enumerate(matrix_years)}
+metric_index = {key: i for i, key in enumerate(metric_keys)}
+
+
+def _metric_value(performance, key):
+    for candidate in [key] + MATRIX_METRICS[key][1]:
+        value = performance.get(candidate)
+        # Text such as "5% annual distribution" carries no comparable number
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return float(value)
+    return np.nan
+
+
+@lru_cache(maxsize=4)
+def get_metric_matrices(version):
+    """Return (raw, normalized) arrays shaped years x semesters x metrics.
+
+    Missing values are NaN. Each metric is min-max scaled to [0, 1] over the
+    whole history so different units can share one colour scale.
+    """
+    raw = np.full((len(matrix_years), len(SEMESTERS), len(metric_keys)), np.nan)
+    for y, year in enumerate(matrix_years):
+        for s, sem in enumerate(SEMESTERS):
+            report = data[year].get(sem)
+            if not isinstance(report, dict):
+                continue
+            performance = report.get("performance_metrics", {})
+            for m, key in enumerate(metric_keys):
+                raw[y, s, m] = _metric_value(performance, key)
+
+    normalized = np.full_like(raw, np.nan)
+    observed = ~np.isnan(raw).all(axis=(0, 1))
+    if observed.any():
+        lo = np.nanmin(raw[:, :, observed], axis=(0, 1))
+        hi = np.nanmax(raw[:, :, observed], axis=(0, 1))
+        span = np.where(hi > lo, hi - lo, 1.0)
+        normalized[:, :, observed] = (raw[:, :, observed] - lo) / span
+    return raw, normalized
+
+
+def period_labels(year_positions):
+    return [f"{matrix_years[y]} - {sem}" for y in year_positions for sem in SEMESTERS]
+
+
+def build_metric_heatmap(year_positions, metric_positions, title):
+    """Heatmap of normalized metrics for the given rows, with raw values on hover."""
+    raw, normalized = get_metric_matrices(data_version)
+    rows = np.ix_(year_positions, range(len(SEMESTERS)), metric_positions)
+    z = normalized[rows].reshape(-1, len(metric_positions))
+    customdata = raw[rows].reshape(-1, len(metric_positions))
+    y_labels = np.array(period_labels(year_positions))
+    # Drop periods with no data for any of the chosen metrics
+    keep = ~np.isnan(customdata).all(axis=1)
+    if not keep.any():
+        return None
+    fig = go.Figure(data=go.Heatmap(
+        z=z[keep],
+        x=[metric_labels[m] for m in metric_positions],
+        y=y_labels[keep],
+        customdata=customdata[keep],
+        colorscale='Viridis',
+        zmin=0,
+        zmax=1,
+        hovertemplate="%{y}<br>%{x}: %{customdata:,.2f}<extra></extra>",
+        colorbar=dict(title="Normalized")
+    ))
+    fig.update_layout(title=title, template="plotly_white")
+    return fig
+
 # External stylesheets: Bootstrap theme and animate.css for animations
 external_stylesheets = [
     dbc.themes.FLATLY,
@@ -54,7 +148,7 @@ overview_layout = dbc.Container([
     html.Div(id='overview-report-content', className="animate__animated animate__fadeInUp")
 ], fluid=True)
 
-# Comparisons tab: Multiple years comparison graph using 6-month returns
+# Comparisons tab: Multi-metric comparison across years plus an all-history heatmap
 comparisons_layout = dbc.Container([
     dbc.Row(
         dbc.Col(
@@ -71,13 +165,28 @@ comparisons_layout = dbc.Container([
                 value=[available_years[0]],
                 multi=True
             )
-        ], width=12, className="mb-4")
+        ], width=8, className="mb-4"),
+        dbc.Col([
+            dbc.Label("Select Metrics:", className="font-weight-bold"),
+            dcc.Dropdown(
+                id='compare-metrics-dropdown',
+                options=[{'label': label, 'value': key} for key, label in zip(metric_keys, metric_labels)],
+                value=["6_month_return"],
+                multi=True
+            )
+        ], width=4, className="mb-4")
     ]),
     dbc.Row(
         dbc.Col(
             dcc.Graph(id='year-comparison-graph', className="animate__animated animate__fadeInUp"),
             width=12
         )
+    ),
+    dbc.Row(
+        dbc.Col(
+            dcc.Graph(id='history-heatmap-graph', className="animate__animated animate__fadeInUp"),
+            width=12
+        )
     )
 ], fluid=True)
 
@@ -202,23 +311,13 @@ def update_overview_report(selected_year, selected_semester):
             sector_figure = go.Figure(data=[go.Pie(labels=labels, values=values, hole=0.4)])
             sector_figure.update_layout(title="Sector Allocation", template="plotly_white")
     
-    heatmap_data = graphs_data.get("heatmap", {})
     heatmap_figure = None
-    if heatmap_data:
-        hm_metrics = heatmap_data.get("metrics", [])
-        spring_vals = heatmap_data.get("Spring", [])
-        fall_vals = heatmap_data.get("Fall", [])
-        z = []
-        y = []
-        if spring_vals:
-            z.append(spring_vals)
-            y.append("Spring")
-        if fall_vals:
-            z.append(fall_vals)
-            y.append("Fall")
-        if z and hm_metrics:
-            heatmap_figure = go.Figure(data=go.Heatmap(z=z, x=hm_metrics, y=y, colorscale='Viridis'))
-            heatmap_figure.update_layout(title="Heatmap", template="plotly_white")
+    if selected_year in year_index:
+        heatmap_figure = build_metric_heatmap(
+            [year_index[selected_year]],
+            list(range(len(metric_keys))),
+            "Heatmap (normalized across all years)"
+        )
     
     kpi_cards = dbc.Row([
         dbc.Col(dbc.Card(
@@ -313,30 +412,70 @@ def update_overview_report(selected_year, selected_semester):
 # Callback for updating the year comparison graph in the Comparisons tab
 @app.callback(
     Output('year-comparison-graph', 'figure'),
-    [Input('compare-years-dropdown', 'value')]
+    [Input('compare-years-dropdown', 'value'),
+     Input('compare-metrics-dropdown', 'value')]
 )
-def update_comparison_graph(selected_years):
-    if not selected_years:
+def update_comparison_graph(selected_years, selected_metrics):
+    if not selected_years or not selected_metrics:
+        return go.Figure()
+    
+    year_positions = [year_index[year] for year in selected_years if year in year_index]
+    metric_positions = [metric_index[key] for key in selected_metrics if key in metric_index]
+    if not year_positions or not metric_positions:
         return go.Figure()
     
-    labels = []
-    values = []
-    for year in selected_years:
-        for sem in data[year]:
-            perf = data[year][sem].get("performance_metrics", {})
-            ret = perf.get("6_month_return", None)
-            if ret is not None:
-                labels.append(f"{year} - {sem}")
-                values.append(ret)
-    fig = go.Figure(data=go.Bar(x=labels, y=values, marker_color='teal'))
+    raw, normalized = get_metric_matrices(data_version)
+    # A single metric is shown in its own units; several are put on a common 0-1 scale
+    source = raw if len(metric_positions) == 1 else normalized
+    rows = np.ix_(year_positions, range(len(SEMESTERS)), metric_positions)
+    values = source[rows].reshape(-1, len(metric_positions))
+    hover_values = raw[rows].reshape(-1, len(metric_positions))
+    labels = np.array(period_labels(year_positions))
+    keep = ~np.isnan(values).all(axis=1)
+    values, hover_values, labels = values[keep], hover_values[keep], labels[keep]
+    
+    fig = go.Figure(data=[
+        go.Bar(
+            x=labels,
+            y=values[:, i],
+            customdata=hover_values[:, i],
+            name=metric_labels[m],
+            hovertemplate="%{x}<br>%{customdata:,.2f}<extra>%{fullData.name}</extra>"
+        )
+        for i, m in enumerate(metric_positions)
+    ])
+    if len(metric_positions) == 1:
+        title = f"{metric_labels[metric_positions[0]]} Comparison Across Selected Years"
+        yaxis_title = metric_labels[metric_positions[0]]
+    else:
+        title = "Metric Comparison Across Selected Years"
+        yaxis_title = "Normalized Value (0-1)"
     fig.update_layout(
-        title="6-Month Return Comparison Across Selected Years",
+        title=title,
         xaxis_title="Year - Semester",
-        yaxis_title="6-Month Return (%)",
+        yaxis_title=yaxis_title,
+        barmode="group",
         template="plotly_white"
     )
     return fig
 
+# Callback for updating the all-history heatmap in the Comparisons tab
+@app.callback(
+    Output('history-heatmap-graph', 'figure'),
+    [Input('compare-metrics-dropdown', 'value')]
+)
+def update_history_heatmap(selected_metrics):
+    metric_positions = [metric_index[key] for key in (selected_metrics or metric_keys) if key in metric_index]
+    fig = build_metric_heatmap(
+        list(range(len(matrix_years))),
+        metric_positions,
+        "All-History Heatmap (normalized per metric)"
+    )
+    if fig is None:
+        return go.Figure()
+    fig.update_layout(height=max(400, 22 * len(matrix_years) * len(SEMESTERS)))
+    return fig
+
 # Callback for updating key findings and future projections in the Findings & Future Projections tab
 @app.callback(
     Output('findings-content', 'children'),